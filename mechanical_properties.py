@@ -1,4 +1,10 @@
 import argparse
+import atexit
+import contextlib
+import functools
+import itertools
+import math
+import os
 import sqlite3
 import sys
 
@@ -46,6 +52,92 @@ DEFUALT_MATERIALS = [
     ('Zn-Alloy', 'Metal', 6800, 80, 31, 250, 330, 50)
 ]
 
+# Open database connections, keyed by absolute filename & tuning so that the connection & its page cache are shared
+_CONN_CACHE : dict[tuple[str, bool], sqlite3.Connection] = {}
+
+def _get_connection(filename : str, create : bool=False, fast : bool=True) -> sqlite3.Connection:
+    """
+    Returns the shared connection to the database contained in the given file, 
+    opening & configuring a new connection if one does not exist yet.
+
+    Arguments:
+        filename : str
+            Name of the file containing the database.
+    Optional Arguments:
+        create : bool, Default = False
+            Indication of whether or not the file should be created if it does not exist.
+            True if it should be created, False if it must already exist.
+        fast : bool, Default = True
+            Indication of whether or not the connection should be tuned for speed (WAL journal, relaxed syncing & larger caches).
+            True if it should be tuned, False if sqlite's defaults (including the rollback journal) should be used.
+    Returns:
+        Connection to the database contained in the given file.
+    Raises:
+        sqlite3.OperationalError
+            If the file does not exist & should not be created.
+        sqlite3.DatabaseError
+            If the file is not a database.
+    """
+    path = os.path.abspath(filename)
+    conn = _CONN_CACHE.get((path, fast))
+
+    if conn is None:
+        conn = sqlite3.connect(f'file:{path}?mode={"rwc" if create else "rw"}', uri=True, cached_statements=MaterialsDatabase.CACHED_STATEMENTS,
+                               isolation_level=None)  # Transactions are managed explicitly
+        try:
+            conn.execute("PRAGMA foreign_keys=ON")
+            if fast:
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                except sqlite3.OperationalError:
+                    # WAL is unavailable for some databases (e.g. in-memory), keep the default journal
+                    pass
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                conn.execute("PRAGMA cache_size=-65536")
+                conn.execute("PRAGMA mmap_size=268435456")
+            else:
+                try:
+                    # The journal mode is stored in the file, so a database previously opened in WAL mode is switched back
+                    conn.execute("PRAGMA journal_mode=DELETE")
+                except sqlite3.OperationalError:
+                    # Leaving WAL mode requires that no other connection has the database open, in which case WAL is kept
+                    pass
+        except sqlite3.DatabaseError:
+            # The file is not a usable database, so the connection is closed rather than shared half configured
+            conn.close()
+            raise
+        _CONN_CACHE[(path, fast)] = conn
+
+    return conn
+
+@atexit.register
+def _close_connections() -> None:
+    """ Closes all of the shared database connections. """
+    for conn in _CONN_CACHE.values():
+        conn.close()
+    _CONN_CACHE.clear()
+
+def _to_property_value(value : str) -> float:
+    """
+    Converts the given text to the value of a mechanical property.
+
+    Arguments:
+        value : str
+            Text that is to be converted. Blank text is converted to None, so that it is stored as NULL.
+    Returns:
+        Value of the mechanical property, or None if the text is blank.
+    Raises:
+        ValueError
+            If the text is not a finite number (e.g. 'inf', 'nan' or '1e400').
+    """
+    if not value:
+        return None
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f'Property values must be finite numbers ({value})')
+    return value
+
 class Filter:
     ''' Class representation of a sqlite database filter. '''
     OPERATORS = ['=', '<>', '<', '>', '>=', '<=']
@@ -71,7 +163,7 @@ class Filter:
     def __init__(self, column : str, value: str or float, operator: str) -> None:
         '''
         Creates an instance of a sqlite database filter.
-        The string representation of this filter can be directly utilized in sqlite queries.
+        The sql representation of this filter can be directly utilized in sqlite queries.
 
         Arguments:
             column : str
@@ -89,11 +181,18 @@ class Filter:
         self.operator = operator
     
     def __str__(self):
-        ''' 
-        Returns a string representation of this filter for printing. 
-        It can also be utilized directly in a sqlite query.
-        '''
+        ''' Returns a string representation of this filter for printing. '''
         return (f'{self.column} {self.operator} "{self.value}"')
+    
+    def to_sql(self) -> tuple[str, list]:
+        '''
+        Returns a sql representation of this filter, which can be utilized directly in a sqlite query.
+        The value is represented by a placeholder so that it can be bound as a parameter.
+
+        Returns:
+            Tuple containing the sql condition & the list of parameters to be bound to it.
+        '''
+        return (f'{self.column} {self.operator} ?', [self.value])
 
 
 class MaterialsDatabase:
@@ -104,93 +203,246 @@ class MaterialsDatabase:
     remain simple while also utilizing the benefits of relational databases. 
     '''
     DEFUALT_MATERIAL_CATEGORIES = ['Metal', 'Polymer', 'Ceramic', 'Composite', 'Other']
+    CACHED_STATEMENTS = 256
+    RETURNING_SUPPORTED = sqlite3.sqlite_version_info >= (3, 35, 0)  # UPDATE ... RETURNING requires sqlite 3.35
+    INSERT_BATCH_SIZE = 100  # Rows per multi-row insert, keeping the parameters below sqlite's historical limit of 999
+
+    # Statements are kept constant so that repeated calls hit sqlite's prepared statement cache
+    _SQL_ADD_MATERIALS = 'INSERT INTO materials(material, category) VALUES {values} ON CONFLICT(material) DO NOTHING'
+    _SQL_ADD_MATERIAL = _SQL_ADD_MATERIALS.format(values='(?, ?)')
+    _SQL_ADD_MATERIALS_BATCH = _SQL_ADD_MATERIALS.format(values=', '.join(['(?, ?)'] * INSERT_BATCH_SIZE))
+    _SQL_ADD_MECHANICAL_PROPERTIES = 'INSERT INTO mechanical_properties(material, density, modulus_of_elasticity, modulus_of_rigidity, yield_strength, ultimate_tensile_strength, percent_elongation) VALUES {values} ON CONFLICT(material) DO NOTHING'
+    _SQL_ADD_MECHANICAL_PROPERTY = _SQL_ADD_MECHANICAL_PROPERTIES.format(values='(?,?,?,?,?,?,?)')
+    _SQL_ADD_MECHANICAL_PROPERTIES_BATCH = _SQL_ADD_MECHANICAL_PROPERTIES.format(values=', '.join(['(?,?,?,?,?,?,?)'] * INSERT_BATCH_SIZE))
+    _SQL_UPDATE_MATERIAL = 'UPDATE materials SET {column} = ? WHERE material = ?'
+    _SQL_UPDATE_MECHANICAL_PROPERTIES = 'UPDATE mechanical_properties SET {column} = ? WHERE material = ?'
+    _SQL_UPDATE_MECHANICAL_PROPERTIES_RETURNING = (_SQL_UPDATE_MECHANICAL_PROPERTIES + ' RETURNING material, '
+        '(SELECT category FROM materials WHERE materials.material = mechanical_properties.material) AS category, '
+        'density, modulus_of_elasticity, modulus_of_rigidity, yield_strength, ultimate_tensile_strength, percent_elongation')
+    _SQL_DELETE_MATERIAL = 'DELETE FROM materials WHERE material = ?'
+    _SQL_GET_MATERIAL_NAMES = 'SELECT material FROM materials'
+    _SQL_GET_BY_MATERIAL = 'SELECT * FROM properties WHERE material = ? LIMIT 1'
+    _SQL_MATERIAL_EXISTS = 'SELECT 1 FROM materials WHERE material = ? LIMIT 1'
+    _SQL_GET_CATEGORY_SUMMARIES = 'SELECT * FROM category_summaries'
+    _SQL_GET_COLUMNS = "SELECT name FROM PRAGMA_TABLE_INFO('properties')"
+    _SQL_GET_MATERIAL_CATEGORIES = 'SELECT category FROM material_categories ORDER BY material_category_id ASC'
+    # Only the indices created by this class are dropped & recreated by bulk loads, indices created by users are kept
+    _SQL_GET_SECONDARY_INDICES = '''
+        SELECT name, sql FROM sqlite_master 
+        WHERE type = 'index' AND sql IS NOT NULL AND tbl_name IN ('materials', 'properties') 
+            AND (name GLOB 'idx_materials_*' OR name GLOB 'idx_properties_*')
+    '''
+    _SQL_DROP_INDEX = 'DROP INDEX "{name}"'
+
+    # Statements creating the entire schema of an empty database
+    _SQL_CREATE_SCHEMA = '''
+        -- Create materials table
+        CREATE TABLE materials(
+            material TEXT UNIQUE NOT NULL PRIMARY KEY,
+            category TEXT,
+            FOREIGN KEY(category) REFERENCES material_categories(category) ON UPDATE CASCADE)
+        WITHOUT ROWID;
+
+        -- Create material categories table
+        CREATE TABLE material_categories(
+            material_category_id INTEGER NOT NULL PRIMARY KEY UNIQUE,
+            category TEXT NOT NULL UNIQUE
+		);
+
+        -- Create mechanical properties table
+        CREATE TABLE mechanical_properties(
+            material TEXT UNIQUE NOT NULL PRIMARY KEY,
+            density INTEGER,
+            modulus_of_elasticity INTEGER,
+            modulus_of_rigidity INTEGER,
+            yield_strength INTEGER,
+            ultimate_tensile_strength INTEGER,
+            percent_elongation INTEGER,
+            FOREIGN KEY(material) REFERENCES materials(material) ON UPDATE CASCADE ON DELETE CASCADE)
+        WITHOUT ROWID;
+
+        -- Create joined properties view (source of the materialized properties table)
+        CREATE VIEW joined_properties
+        AS
+        SELECT
+            materials.material,
+            category,
+            density,
+            modulus_of_elasticity,
+            modulus_of_rigidity,
+            yield_strength,
+            ultimate_tensile_strength,
+            percent_elongation
+        FROM
+            materials
+        INNER JOIN material_categories USING(category)
+        INNER JOIN mechanical_properties USING(material);
+
+        -- Create properties table, materializing the joined properties view
+        CREATE TABLE properties(
+            material TEXT NOT NULL PRIMARY KEY,
+            category TEXT,
+            density INTEGER,
+            modulus_of_elasticity INTEGER,
+            modulus_of_rigidity INTEGER,
+            yield_strength INTEGER,
+            ultimate_tensile_strength INTEGER,
+            percent_elongation INTEGER)
+        WITHOUT ROWID;
+
+        -- Create triggers that refresh the properties table whenever the underlying tables are altered
+        -- (rows are deleted before being inserted again, so that the properties table's delete trigger sees every removed row)
+        CREATE TRIGGER refresh_properties_after_material_update AFTER UPDATE ON materials
+        BEGIN
+            DELETE FROM properties WHERE material IN (OLD.material, NEW.material);
+            INSERT INTO properties SELECT * FROM joined_properties WHERE material = NEW.material;
+        END;
+        CREATE TRIGGER refresh_properties_after_material_delete AFTER DELETE ON materials
+        BEGIN
+            DELETE FROM properties WHERE material = OLD.material;
+        END;
+        CREATE TRIGGER refresh_properties_after_mechanical_properties_insert AFTER INSERT ON mechanical_properties
+        BEGIN
+            DELETE FROM properties WHERE material = NEW.material;
+            INSERT INTO properties SELECT * FROM joined_properties WHERE material = NEW.material;
+        END;
+        CREATE TRIGGER refresh_properties_after_mechanical_properties_update AFTER UPDATE ON mechanical_properties
+        BEGIN
+            DELETE FROM properties WHERE material IN (OLD.material, NEW.material);
+            INSERT INTO properties SELECT * FROM joined_properties WHERE material = NEW.material;
+        END;
+        CREATE TRIGGER refresh_properties_after_mechanical_properties_delete AFTER DELETE ON mechanical_properties
+        BEGIN
+            DELETE FROM properties WHERE material = OLD.material;
+        END;
+
+        -- Create category statistics table, materializing the summary of each material category
+        -- (categories whose materials have changed are marked stale & recomputed once before the change is committed)
+        CREATE TABLE category_stats(
+            material_category_id INTEGER NOT NULL PRIMARY KEY,
+            materials INTEGER NOT NULL DEFAULT 0,
+            density REAL,
+            modulus_of_elasticity REAL,
+            modulus_of_rigidity REAL,
+            yield_strength REAL,
+            ultimate_tensile_strength REAL,
+            percent_elongation REAL,
+            stale INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY(material_category_id) REFERENCES material_categories(material_category_id) ON DELETE CASCADE);
+
+        -- Create triggers that mark the categories affected by each change to the properties table as stale
+        CREATE TRIGGER create_category_stats_after_material_category_insert AFTER INSERT ON material_categories
+        BEGIN
+            INSERT INTO category_stats(material_category_id) VALUES (NEW.material_category_id);
+        END;
+        CREATE TRIGGER refresh_category_stats_after_properties_insert AFTER INSERT ON properties
+        BEGIN
+            UPDATE category_stats SET stale = 1
+            WHERE material_category_id IN (SELECT material_category_id FROM material_categories WHERE category = NEW.category);
+        END;
+        CREATE TRIGGER refresh_category_stats_after_properties_update AFTER UPDATE ON properties
+        BEGIN
+            UPDATE category_stats SET stale = 1
+            WHERE material_category_id IN (SELECT material_category_id FROM material_categories WHERE category IN (OLD.category, NEW.category));
+        END;
+        CREATE TRIGGER refresh_category_stats_after_properties_delete AFTER DELETE ON properties
+        BEGIN
+            UPDATE category_stats SET stale = 1
+            WHERE material_category_id IN (SELECT material_category_id FROM material_categories WHERE category = OLD.category);
+        END;
+
+        -- Create category summaries view
+        CREATE VIEW category_summaries
+        AS
+        SELECT
+            category,
+            materials,
+            IFNULL(density, "") AS density,
+            IFNULL(modulus_of_elasticity, "") AS modulus_of_elasticity,
+            IFNULL(modulus_of_rigidity, "") AS modulus_of_rigidity,
+            IFNULL(yield_strength, "") AS yield_strength,
+            IFNULL(ultimate_tensile_strength, "") AS ultimate_tensile_strength,
+            IFNULL(percent_elongation, "") AS percent_elongation
+        FROM
+            material_categories
+        INNER JOIN category_stats USING(material_category_id)
+        ORDER BY
+            material_category_id ASC;
+    '''
+    # Indices are created only if missing, so that they can also be added to existing databases
+    _SQL_CREATE_MATERIALS_INDICES = '''
+        -- Create index used when looking up the materials of a category
+        CREATE INDEX IF NOT EXISTS idx_materials_category ON materials(category);
+    '''
+    # Only databases in which properties is a table (rather than the original view) can be indexed
+    _SQL_CREATE_PROPERTIES_INDICES = '''
+        -- Create indices used when filtering & sorting properties
+        CREATE INDEX IF NOT EXISTS idx_properties_category ON properties(category);
+        CREATE INDEX IF NOT EXISTS idx_properties_density ON properties(density);
+        CREATE INDEX IF NOT EXISTS idx_properties_modulus_of_elasticity ON properties(modulus_of_elasticity);
+        CREATE INDEX IF NOT EXISTS idx_properties_modulus_of_rigidity ON properties(modulus_of_rigidity);
+        CREATE INDEX IF NOT EXISTS idx_properties_yield_strength ON properties(yield_strength);
+        CREATE INDEX IF NOT EXISTS idx_properties_ultimate_tensile_strength ON properties(ultimate_tensile_strength);
+        CREATE INDEX IF NOT EXISTS idx_properties_percent_elongation ON properties(percent_elongation);
+    '''
+    _SQL_ADD_MATERIAL_CATEGORY = 'INSERT INTO material_categories(category) VALUES (?)'
+    _SQL_GET_OBJECT_TYPE = 'SELECT type FROM sqlite_master WHERE name = ?'
+    _SQL_HAS_STALE_CATEGORY_STATS = 'SELECT 1 FROM category_stats WHERE stale LIMIT 1'
+    _SQL_REFRESH_CATEGORY_STATS = '''
+        UPDATE category_stats
+        SET (materials, density, modulus_of_elasticity, modulus_of_rigidity, yield_strength, ultimate_tensile_strength, percent_elongation, stale) = (
+            SELECT count(material), avg(density), avg(modulus_of_elasticity), avg(modulus_of_rigidity), avg(yield_strength), avg(ultimate_tensile_strength), avg(percent_elongation), 0
+            FROM properties INNER JOIN material_categories USING(category)
+            WHERE material_categories.material_category_id = category_stats.material_category_id)
+        WHERE stale
+    '''
+
+    class InvalidColumn(Exception):
+        ''' Exception used to indicate that the given column is not contained in the database. '''
+        def __init__(self, column : str) -> None:
+            ''' 
+            Creates an intance of an Invalid Column Exception, including 
+            a message indicating the given invalid column.
+            
+            Arguments:
+                column : str
+                    Invalid column
+            '''
+            super().__init__()
+            self.message = f'Invalid Column ({column}): Column does not exist'
+        
+        def __str__(self):
+            ''' Returns string representation of the exception. '''
+            return self.message
 
     @staticmethod
-    def create_database(filename : str) -> None:
+    def create_database(filename : str, fast : bool=True) -> None:
         '''
         Static method that creates an empty database. The database is stored in a file with the given filename.
         
         Arguments:
             filename : str
                 Filename that is to be used for the newly created empty database.
+        Optional Arguments:
+            fast : bool, Default = True
+                Indication of whether or not the database connection should be tuned for speed, as for MaterialsDatabase.
+                False creates the database with sqlite's default rollback journal rather than a write-ahead log.
         '''
-        conn = sqlite3.connect(filename)
+        conn = _get_connection(filename, create=True, fast=fast)
         cur = conn.cursor()
 
-        # Create materials table
-        cur.execute('''
-            CREATE TABLE materials(
-                material TEXT UNIQUE NOT NULL PRIMARY KEY,
-                category TEXT,
-                FOREIGN KEY(category) REFERENCES material_categories(category) ON UPDATE CASCADE);''')
-        
-        # Create material categories table
-        cur.execute('''
-            CREATE TABLE material_categories(
-                material_category_id INTEGER NOT NULL PRIMARY KEY UNIQUE,
-                category TEXT NOT NULL UNIQUE
-				);''')
-
-        # Create mechanical properties table
-        cur.execute('''
-            CREATE TABLE mechanical_properties(
-                material TEXT UNIQUE NOT NULL PRIMARY KEY,
-                density INTEGER,
-                modulus_of_elasticity INTEGER,
-                modulus_of_rigidity INTEGER,
-                yield_strength INTEGER,
-                ultimate_tensile_strength INTEGER,
-                percent_elongation INTEGER,
-                FOREIGN KEY(material) REFERENCES materials(material) ON UPDATE CASCADE ON DELETE CASCADE);''')
-        
-        # Populate material categories table
-        for category in MaterialsDatabase.DEFUALT_MATERIAL_CATEGORIES:
-            cur.execute('''
-                INSERT INTO material_categories(category) VALUES (?); ''', (category,))
-
-        # Create properties view
-        cur.execute('''
-            CREATE VIEW properties
-            AS
-            SELECT
-                materials.material,
-                category,
-                density,
-                modulus_of_elasticity,
-                modulus_of_rigidity,
-                yield_strength,
-                ultimate_tensile_strength,
-                percent_elongation
-            FROM
-                materials
-            INNER JOIN material_categories USING(category)
-            INNER JOIN mechanical_properties USING(material);''')
-        
-        # Create category summaries view
-        cur.execute('''
-            CREATE VIEW category_summaries 
-            AS
-            SELECT
-                category,
-                count(material) AS materials,
-                IFNULL(avg(density), "") AS density,
-                IFNULL(avg(modulus_of_elasticity), "") AS modulus_of_elasticity,
-                IFNULL(avg(modulus_of_rigidity), "") AS modulus_of_rigidity,
-                IFNULL(avg(yield_strength), "") AS yield_strength,
-                IFNULL(avg(ultimate_tensile_strength), "") AS ultimate_tensile_strength,
-                IFNULL(avg(percent_elongation), "") AS percent_elongation
-            FROM
-                material_categories
-            LEFT JOIN properties USING(category)
-            GROUP BY
-                category
-            ORDER BY
-                material_category_id ASC; 
-        ''')
-
+        # Create the entire schema & default categories within a single transaction
+        try:
+            cur.executescript('BEGIN;' + MaterialsDatabase._SQL_CREATE_SCHEMA + 
+                              MaterialsDatabase._SQL_CREATE_MATERIALS_INDICES + MaterialsDatabase._SQL_CREATE_PROPERTIES_INDICES)
+            cur.executemany(MaterialsDatabase._SQL_ADD_MATERIAL_CATEGORY, [(category,) for category in MaterialsDatabase.DEFUALT_MATERIAL_CATEGORIES])
+        except sqlite3.Error:
+            # Leave the shared connection without a pending transaction
+            conn.rollback()
+            raise
         conn.commit()
 
-    def __init__(self, filename : str) -> None:
+    def __init__(self, filename : str, fast : bool=True) -> None:
         '''
         Creates an empty sqlite database that can store materials and thier mechanical properties.
         This class contains methods that can be used to interact with the database.
@@ -198,44 +450,167 @@ class MaterialsDatabase:
         Arguments:
             filename : str
                 Name of the file in which the empty database should stored.
+        Optional Arguments:
+            fast : bool, Default = True
+                Indication of whether or not the database connection should be tuned for speed.
+                The tuning switches the database to a write-ahead log, which creates -wal & -shm files next to the database file.
+                False uses sqlite's default settings, switching a database previously opened in WAL mode back to the 
+                rollback journal (unless another connection, e.g. one opened with fast=True, has the database open).
         '''
-        self.__CONN = sqlite3.connect(f'file:{filename}?mode=rw', uri=True)
+        self.__CONN = _get_connection(filename, fast=fast)
         self.__CUR = self.__CONN.cursor()
         self.__CUR.row_factory = sqlite3.Row
-        self.__CUR.execute("PRAGMA foreign_keys=ON")
-        self.__filters = []
+        self.__FAST_CUR = self.__CONN.cursor()  # Returns plain tuples for bulk reads
+        # Databases created before the indices were added lack them
+        self.__CUR.executescript(self._SQL_CREATE_MATERIALS_INDICES)
+        properties_type = self.__FAST_CUR.execute(self._SQL_GET_OBJECT_TYPE, ('properties',)).fetchone()
+        if properties_type is not None and properties_type[0] == 'table':
+            self.__CUR.executescript(self._SQL_CREATE_PROPERTIES_INDICES)
+        # Databases created before the category statistics were added summarize categories entirely within their view
+        self.__has_category_stats = self.__FAST_CUR.execute(self._SQL_GET_OBJECT_TYPE, ('category_stats',)).fetchone() is not None
+        self.__filters = {}  # Filters keyed by their column & operator, in the order they were added
+        self.__filters_sql = {}  # Filter WHERE clauses, keyed by the columns & operators of the filters
+
+        # Sorted selections, prebuilt for each valid column & direction so that only known SQL is executed
+        self.__column_positions = {column['name']: position for position, column in enumerate(self.get_columns())}
+        self.__sorted_sql = {(column, descending): self.__build_sorted_sql(column, descending) 
+                             for column in self.__column_positions for descending in (False, True)}
+
+        # Updates, prebuilt for each valid column so that the same statement text is reused for every update of a column
+        update_mechanical_properties_sql = self._SQL_UPDATE_MECHANICAL_PROPERTIES_RETURNING if self.RETURNING_SUPPORTED else self._SQL_UPDATE_MECHANICAL_PROPERTIES
+        self.__update_sql = {column: (self._SQL_UPDATE_MATERIAL if column in ['material', 'category'] else update_mechanical_properties_sql).format(column=column)
+                             for column in self.__column_positions}
+
+    def __build_sorted_sql(self, column : str, descending : bool) -> tuple[str, str, str]:
+        """
+        Builds the statements used to select entries ordered by the given column. 
+        Entries are also ordered by material, so that the entries following a given entry are well defined.
+
+        Arguments:
+            column : str
+                Column that should be used to order the entries.
+            descending : bool
+                Indication of whether or not the column should be ordered in descending order.
+        Returns:
+            Tuple containing the statements selecting all entries, the first page of entries (:limit) 
+            & the page of entries following a given entry (:value of the column, :material, :limit).
+            The selected columns are left as a {columns} placeholder.
+        """
+        direction, comparison = ('DESC', '<') if descending else ('ASC', '>')
+
+        if column == 'material':
+            order_by = f'ORDER BY material {direction}'
+            after = f'material {comparison} :material'
+        else:
+            order_by = f'ORDER BY {column} {direction}, material {direction}'
+            # NULLs are ordered before all values, so they are compared explicitly
+            after = (f'({column} {comparison} :value OR ({column} IS :value AND material {comparison} :material) OR '
+                     f'(:value IS {"NOT " if descending else ""}NULL AND {column} IS {"" if descending else "NOT "}NULL))')
+
+        return (f'SELECT {{columns}} FROM properties {order_by}',
+                f'SELECT {{columns}} FROM properties {order_by} LIMIT :limit',
+                f'SELECT {{columns}} FROM properties WHERE {after} {order_by} LIMIT :limit')
+
+    @contextlib.contextmanager
+    def __transaction(self):
+        """
+        Context manager that performs the enclosed statements within a single transaction.
+        The write lock is taken when the transaction begins, so that the transaction never has to wait to upgrade its lock.
+        The transaction is committed if the enclosed statements succeed, otherwise it is rolled back.
+        The statistics of the material categories changed by the transaction are recomputed once, before it is committed.
+        """
+        self.__CUR.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+            self.__refresh_category_stats()
+        except BaseException:
+            self.__CUR.execute('ROLLBACK')
+            raise
+        self.__CUR.execute('COMMIT')
+
+    def __refresh_category_stats(self) -> None:
+        """
+        Recomputes the statistics of the material categories that have been marked stale, 
+        using the materials currently contained in the properties table.
+        """
+        if self.__has_category_stats:
+            self.__CUR.execute(self._SQL_REFRESH_CATEGORY_STATS)
     
     ####################################################################################################
     #                                             Entries                                              #    
     ####################################################################################################
-    def __add_material(self, name : str, category : str):
+    def __add_materials(self, materials : list[tuple]) -> int:
         """ 
-        Adds a material to the materials table of this database using the given name and material category.
-        The material category must be contained in the material_categories table of this database.
+        Adds materials to the materials table of this database using the given names and material categories.
+        The material categories must be contained in the material_categories table of this database.
+        Materials that already exist are skipped.
 
         Arguments:
-            name : str
-                Name of the materials that is to be added to the database.
-            category : str
-                Name of the category to which the added material belongs. 
-                (This category must be contained in the material_categories table of this database.)
+            materials : list[tuple]
+                List of (name, category) pairs for the materials that are to be added to the database. 
+                (Each category must be contained in the material_categories table of this database.)
+        Returns:
+            Number of materials added to the materials table.
         """
-        self.__CUR.execute("INSERT INTO materials(material, category) VALUES (?, ?)", (name, category))
+        return self.__insert_rows(self._SQL_ADD_MATERIAL, self._SQL_ADD_MATERIALS_BATCH, materials)
 
-    def __add_mechanical_properties(self, material : str, properties : list) -> None:
+    def __add_mechanical_properties(self, properties : list[tuple]) -> None:
         """
-        Adds a material's properties to the mechanical properties table of this database using the given material name and its properties.
-        The material must be contained in the materials table of this database.
+        Adds materials' properties to the mechanical properties table of this database using the given material names and their properties.
+        The materials must be contained in the materials table of this database.
 
         Arguments:
-            material : str
-                Name of the material for which the properties are to be added to the database.
-            properties : list
-                List of values for the properties of the material with the given name.
-                (This material must be contained in the materials table of this database.)
+            properties : list[tuple]
+                List of (material, *properties) tuples containing the name of each material followed by the values for its properties.
+                (Each material must be contained in the materials table of this database.)
+                Materials that already have properties are skipped.
+        """
+        self.__insert_rows(self._SQL_ADD_MECHANICAL_PROPERTY, self._SQL_ADD_MECHANICAL_PROPERTIES_BATCH, properties)
+
+    def __insert_rows(self, sql : str, batch_sql : str, rows : list[tuple]) -> int:
         """
-        self.__CUR.execute("INSERT INTO mechanical_properties(material, density, modulus_of_elasticity, modulus_of_rigidity, yield_strength, ultimate_tensile_strength, percent_elongation) VALUES (?,?,?,?,?,?,?)", (material, *properties))
+        Inserts the given rows, INSERT_BATCH_SIZE rows per statement using the multi-row insert.
+        The remaining rows are inserted using the single row insert, so that only these two statements are ever prepared.
+
+        Arguments:
+            sql : str
+                Statement inserting a single row.
+            batch_sql : str
+                Statement inserting INSERT_BATCH_SIZE rows.
+            rows : list[tuple]
+                Rows that are to be inserted.
+        Returns:
+            Number of rows inserted.
+        """
+        num_batched = len(rows) - len(rows) % self.INSERT_BATCH_SIZE
+        num_inserted = 0
+        for start in range(0, num_batched, self.INSERT_BATCH_SIZE):
+            params = list(itertools.chain.from_iterable(rows[start:start + self.INSERT_BATCH_SIZE]))
+            num_inserted += self.__CUR.execute(batch_sql, params).rowcount
+        if num_batched < len(rows):
+            num_inserted += self.__CUR.executemany(sql, rows[num_batched:]).rowcount
+        return num_inserted
     
+    def add_entries(self, entries : list[tuple]) -> int:
+        """
+        Adds multiple entries to this database within a single transaction. 
+        Entries for materials that already exist are skipped, leaving the existing materials unchanged.
+
+        Arguments:
+            entries : list[tuple]
+                List of (name, category, properties) tuples for the materials to be added to this database.
+        Returns:
+            Number of entries added to this database.
+        Raises:
+            sqlite3.IntegrityError
+                If the category of any of the materials is not contained in this database, in which case none of the entries are added.
+        """
+        entries = list(entries)
+        with self.__transaction():
+            num_added = self.__add_materials([(name, category) for name, category, _ in entries])
+            self.__add_mechanical_properties([(name, *properties) for name, _, properties in entries])
+        return num_added
+
     def add_entry(self, name : str, category : str, properties : str) -> None:
         """
         Adds an entry to this database with the given material name, material cataegory and material properties.
@@ -248,15 +623,40 @@ class MaterialsDatabase:
             properties : list
                 Properties of the material to be added to this database.
         """
-        try:
-            # Add material to materials table
-            self.__add_material(name, category)
-        except sqlite3.IntegrityError:
+        if not self.add_entries([(name, category, properties)]):
             print(f"'{name}' already exists, please update that material instead...")
-        else:
-            # Add properties to mechanical properties table
-            self.__add_mechanical_properties(name, properties)
-            self.__CONN.commit()
+
+    def bulk_load(self, entries : list[tuple]) -> int:
+        """
+        Adds a large number of entries to this database within a single transaction, in the same way as add_entries.
+        The secondary indices created by this class are dropped during the load, then recreated once all of the entries 
+        have been added, which is faster than updating them for each entry.
+        The query planner's statistics are refreshed afterwards.
+
+        Arguments:
+            entries : list[tuple]
+                List of (name, category, properties) tuples for the materials to be added to this database.
+        Returns:
+            Number of entries added to this database.
+        Raises:
+            sqlite3.IntegrityError
+                If the category of any of the materials is not contained in this database, in which case none of the entries are added.
+        """
+        entries = list(entries)
+        with self.__transaction():
+            # Definitions are read from the schema itself, so that they are recreated exactly as they were
+            indices = self.__FAST_CUR.execute(self._SQL_GET_SECONDARY_INDICES).fetchall()
+            for name, _ in indices:
+                self.__FAST_CUR.execute(self._SQL_DROP_INDEX.format(name=name.replace('"', '""')))
+
+            num_added = self.__add_materials([(name, category) for name, category, _ in entries])
+            self.__add_mechanical_properties([(name, *properties) for name, _, properties in entries])
+
+            for _, sql in indices:
+                self.__FAST_CUR.execute(sql)
+
+        self.__FAST_CUR.execute('ANALYZE')
+        return num_added
     
     def __update_material(self, name : str, column : str, value : str) -> None:
         """
@@ -270,16 +670,9 @@ class MaterialsDatabase:
             value : str
                 Value to which the attribute should be updated 
         """
-        self.__CUR.execute(f'''
-            UPDATE materials
-            SET
-                {column} = ?
-            WHERE
-                material = ?;
-        ''', (value, name))
-        self.__CONN.commit()
+        self.__CUR.execute(self.__update_sql[column], (value, name))
     
-    def __update_mechanical_properties(self, name : str, column : str, value) -> None:
+    def __update_mechanical_properties(self, name : str, column : str, value) -> sqlite3.Row:
         """
         Updates the specified property for the given material.
 
@@ -290,14 +683,16 @@ class MaterialsDatabase:
                 Name of the property which should be updated.
             value : str
                 Value to which the property should be updated 
+        Returns:
+            Updated material, returned by the update itself, or None if the material does not exist.
+            Always None if the sqlite library does not support RETURNING.
         """
-        self.__CUR.execute(f'''
-            UPDATE mechanical_properties
-            SET
-                {column} = ?
-            WHERE
-                material = ? ;''', (value, name))
-        self.__CONN.commit()
+        results = self.__CUR.execute(self.__update_sql[column], (value, name))
+
+        if self.RETURNING_SUPPORTED:
+            updated_materials = results.fetchall()
+            return updated_materials[0] if updated_materials else None
+        return None
     
     def update_entry(self, name, column, value):
         """
@@ -310,14 +705,30 @@ class MaterialsDatabase:
                 Name of the column which should be updated.
             value : str
                 Value to which the column should be updated. 
+        Returns:
+            Updated material, or None if the material does not exist.
+        Raises:
+            MaterialsDatabase.InvalidColumn
+                If the column is not contained in this database.
+            ValueError
+                If the value of a property is not a finite number.
         """
-        if column in ['material', 'category']:
-            self.__update_material(name, column, value)
-        else:
-            if value:
-                value = eval(value)
-            self.__update_mechanical_properties(name, column, value)
-        self.__CONN.commit()
+        # Only the prebuilt update statements of existing columns are executed
+        if column not in self.__update_sql:
+            raise MaterialsDatabase.InvalidColumn(column)
+
+        # Property values are converted before the transaction, so that invalid values never take the write lock
+        if column not in ['material', 'category']:
+            value = _to_property_value(value)
+
+        with self.__transaction():
+            if column in ['material', 'category']:
+                self.__update_material(name, column, value)
+            else:
+                # The updated material is returned by the update itself when supported
+                if self.RETURNING_SUPPORTED:
+                    return self.__update_mechanical_properties(name, column, value)
+                self.__update_mechanical_properties(name, column, value)
 
         # Update name so that it reflects the newly altered material name
         if column == 'material':
@@ -337,29 +748,35 @@ class MaterialsDatabase:
             Boolean indication of whether or not the material has been deleted.
             True if material has been deleted, False otherwise. 
         """
-        self.__CUR.execute('''
-            DELETE FROM materials
-            WHERE material = ?;''', (name,))
+        with self.__transaction():
+            # Indicate whether or not the material has been deleted
+            deleted = self.__CUR.execute(self._SQL_DELETE_MATERIAL, (name,)).rowcount == 1
         
-        # Indicate whether or not the material has been deleted
-        if self.__CUR.rowcount == 1:
-            self.__CONN.commit()
-            return True
-        else:
-            return False
+        return deleted
     
     def insert_default_materials(self):
         """ Inserts the default materials into this database. """
+        existing_materials = {material['material'] for material in self.__CUR.execute(self._SQL_GET_MATERIAL_NAMES)}
+
+        entries = []
         for material in DEFUALT_MATERIALS:
             name, category, *properties = material
-            self.add_entry(name, category, properties)
+            if name in existing_materials:
+                print(f"'{name}' already exists, please update that material instead...")
+            else:
+                entries.append((name, category, properties))
+
+        try:
+            self.add_entries(entries)
+        except sqlite3.IntegrityError as e:
+            print(f'Default materials could not be added ({e})...')
     
     ####################################################################################################
     #                                             Filters                                              #    
     ####################################################################################################
     def add_filter(self, column : str, value, operator : str) -> None:
         """
-        Adds a filter to this database.
+        Adds a filter to this database, replacing any existing filter with the same column & operator.
 
         Arguments:
             column : str
@@ -369,7 +786,7 @@ class MaterialsDatabase:
             operator : str
                 Operator indicating how the value should be compared.
         """
-        self.__filters.append(Filter(column, value, operator))
+        self.__filters[(column, operator)] = Filter(column, value, operator)
 
     def remove_filter(self, filter : Filter) -> None:
         """ 
@@ -379,36 +796,61 @@ class MaterialsDatabase:
             filter : Filter
                 Existing filter to be removed
         """
-        self.__filters.remove(filter)
+        del self.__filters[(filter.column, filter.operator)]
         
     def clear_filters(self):
         """ Removes all existing filters from this database. """
-        self.__filters = []
+        self.__filters.clear()
     
     ####################################################################################################
     #                                            Selections                                            #    
     ####################################################################################################
-    def get_all_entries(self, order_by:str='material', descending:bool=False):
+    def get_all_entries(self, order_by:str='material', descending:bool=False, limit:int=None, after:tuple=None, columns:list[str]=None):
         """
-        Returns all entries currently contined in this database.
+        Returns all entries currently contined in this database, or a page of them if a limit is given.
 
         Optional Arguments:
             order_by : str, Default = 'material'
-                Column that should be used to order the entries.
+                Column that should be used to order the entries. Ties are ordered by material.
             descending : bool, Default = False
                 Indication of whether or not the column should be ordered in descending order.
                 True if descending order, False if ascending order
+            limit : int, Default = None
+                Maximum number of entries that should be returned. All entries are returned if None.
+            after : tuple, Default = None
+                Entry after which the returned entries should start, e.g. the last entry of the previous page.
+                Entries start from the first entry if None. (Only used if a limit is given.)
+            columns : list[str], Default = None
+                Columns that should be returned for each entry, in order. All columns are returned if None.
+                When paging, the columns must include material & the order by column.
         Returns:
-            List containing all of the entries currently contained in this database.
+            Cursor that lazily yields all of the entries currently contained in this database, as tuples.
+        Raises:
+            MaterialsDatabase.InvalidColumn
+                If the order by column, or any of the given columns, is not contained in this database.
         """
-        results = self.__CUR.execute(f'''
-        SELECT
-            *
-        FROM
-	        properties
-         ORDER BY
-            {order_by + f'{" ASC " if not descending else " DESC "}'} ;''')
-        return results.fetchall()
+        try:
+            all_sql, first_page_sql, next_page_sql = self.__sorted_sql[(order_by, descending)]
+        except KeyError:
+            raise MaterialsDatabase.InvalidColumn(order_by)
+
+        if columns is None:
+            selected_columns, positions = '*', self.__column_positions
+        else:
+            for column in columns:
+                if column not in self.__column_positions:
+                    raise MaterialsDatabase.InvalidColumn(column)
+            selected_columns, positions = ', '.join(columns), {column: position for position, column in enumerate(columns)}
+
+        # Each selection gets a cursor of its own, so that later queries do not exhaust the returned entries
+        cursor = self.__CONN.cursor()
+        if limit is None:
+            return cursor.execute(all_sql.format(columns=selected_columns))
+        elif after is None:
+            return cursor.execute(first_page_sql.format(columns=selected_columns), {'limit': limit})
+        else:
+            params = {'value': after[positions[order_by]], 'material': after[positions['material']], 'limit': limit}
+            return cursor.execute(next_page_sql.format(columns=selected_columns), params)
 
     def get_entry_by_material(self, material : str) -> sqlite3.Row:
         """
@@ -420,32 +862,78 @@ class MaterialsDatabase:
         Returns:
             Specific material currently contained in this database.
         """
-        results = self.__CUR.execute(f'''
-        SELECT
-            *
-        FROM
-	        properties
-        WHERE
-            material = ?;''', (material,))
+        results = self.__CUR.execute(self._SQL_GET_BY_MATERIAL, (material,))
         return results.fetchone()
+
+    def material_exists(self, material : str) -> bool:
+        """
+        Returns whether or not a specific material is currently contained in this database,
+        without reading any of its properties.
+
+        Arguments:
+            material : str
+                Name of material that should be checked.
+        Returns:
+            True if the material is contained in this database, False otherwise.
+        """
+        results = self.__FAST_CUR.execute(self._SQL_MATERIAL_EXISTS, (material,))
+        return results.fetchone() is not None
     
-    def get_filtered_entries(self):
+    def __get_filters_sql(self) -> tuple[str, list]:
+        """
+        Returns a sql WHERE clause representing this database's current filters.
+
+        Returns:
+            Tuple containing the sql WHERE clause & the list of parameters to be bound to it.
+        """
+        # Filters with the same columns & operators share their sql, only the bound values differ
+        signature = tuple(self.__filters)
+        if signature not in self.__filters_sql:
+            self.__filters_sql[signature] = ' WHERE ' + ' AND '.join(filter.to_sql()[0] for filter in self.__filters.values())
+
+        params = list(itertools.chain.from_iterable(filter.to_sql()[1] for filter in self.__filters.values()))
+        return (self.__filters_sql[signature], params)
+
+    def get_filtered_entries(self, limit : int=None, after : tuple=None):
         """
         Returns all of the entries currently contained in this database that satisfy the requirements of
+        this database's current filters ordered by material, or a page of them if a limit is given.
+
+        Optional Arguments:
+            limit : int, Default = None
+                Maximum number of entries that should be returned. All entries are returned if None.
+            after : tuple, Default = None
+                Entry after which the returned entries should start, e.g. the last entry of the previous page.
+                Entries start from the first entry if None. (Only used if a limit is given.)
+        Returns:
+            Cursor that lazily yields all the entries currently contained in this database that satisfy 
+            the requirements of this database's current filters, as tuples.
+        """
+        where, params = self.__get_filters_sql()
+        if limit is not None and after is not None:
+            where += ' AND material > ?'
+            params.append(after[0])
+        
+        sql = 'SELECT * FROM properties' + where + ' ORDER BY material'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        # Each selection gets a cursor of its own, so that later queries do not exhaust the returned entries
+        return self.__CONN.cursor().execute(sql, params)
+
+    def get_filtered_count(self) -> int:
+        """
+        Returns the number of entries currently contained in this database that satisfy the requirements of
         this database's current filters.
 
         Returns:
-            List of all the entries currently contained in this database that satisfy the requirements of
+            Number of entries currently contained in this database that satisfy the requirements of
             this database's current filters.
         """
-        results = self.__CUR.execute(f'''
-            SELECT
-                *
-            FROM
-                properties
-            WHERE
-                {' AND '.join([f'{filter}' for filter in self.__filters])};''')
-        return results.fetchall()
+        where, params = self.__get_filters_sql()
+        results = self.__FAST_CUR.execute('SELECT count(*) FROM properties' + where, params)
+        return results.fetchone()[0]
     
     def get_category_summaries(self):
         """
@@ -454,12 +942,33 @@ class MaterialsDatabase:
         Returns:
             Returns a list of entries that summarize the characteristics of each material category.
         """
-        results = self.__CUR.execute('SELECT * FROM category_summaries')
+        # Categories changed outside of this class (e.g. by another program) are still stale
+        if self.__has_category_stats and self.__FAST_CUR.execute(self._SQL_HAS_STALE_CATEGORY_STATS).fetchone() is not None:
+            with self.__transaction():
+                self.__refresh_category_stats()
+        results = self.__CUR.execute(self._SQL_GET_CATEGORY_SUMMARIES)
         return results.fetchall()
     
     ####################################################################################################
     #                                            Attributes                                            #    
     ####################################################################################################
+    @functools.cached_property
+    def columns(self):
+        """ List of this database's columns, queried once & cached as the schema does not change. """
+        results = self.__CUR.execute(self._SQL_GET_COLUMNS)
+        return results.fetchall()
+
+    @functools.cached_property
+    def material_categories(self):
+        """ List of material categories contained in the database, queried once & cached as the categories do not change. """
+        results = self.__CUR.execute(self._SQL_GET_MATERIAL_CATEGORIES)
+        return results.fetchall()
+
+    def clear_attribute_cache(self) -> None:
+        """ Clears the cached columns & material categories, so that they are queried again when next used. """
+        self.__dict__.pop('columns', None)
+        self.__dict__.pop('material_categories', None)
+
     def get_columns(self):
         """
         Returns a list of this database's columns.
@@ -467,13 +976,7 @@ class MaterialsDatabase:
         Returns:
             List of this database's columns.
         """
-        results = self.__CUR.execute('''
-            SELECT 
-                name 
-            FROM 
-                PRAGMA_TABLE_INFO('properties');
-        ''')
-        return results.fetchall()
+        return self.columns
 
     def get_material_categories(self):
         """
@@ -482,14 +985,7 @@ class MaterialsDatabase:
         Returns:
             List of material categories currently contained in the database.
         """
-        results = self.__CUR.execute('''
-        SELECT
-            category
-        FROM
-	        material_categories
-         ORDER BY
-            material_category_id ASC;''')
-        return results.fetchall()
+        return self.material_categories
     
     def get_filters(self):
         """
@@ -498,13 +994,15 @@ class MaterialsDatabase:
         Returns:
             List of this database's current filters.
         """
-        return self.__filters
+        return list(self.__filters.values())
 
 
 class MaterialsDatabaseEditor:
     """ Class that facilitates user interaction of a material properties database. """
     COLUMN_DISPLAYS = {'material':'Material', 'materials': 'Materials', 'category':'Category', 'density':'ρ(kg/m³)', 'modulus_of_elasticity':'E(GPa)', 'modulus_of_rigidity':'G(GPa)', 'yield_strength':'σy(MPa)', 'ultimate_tensile_strength':'σult(MPa)', 'percent_elongation':r'%EL'}
     COLUMN_SPACING = 15
+    PAGE_SIZE = 25
+    PROPERTY_LABELS = ['Density (kg/m³)', 'Modulus of Elasticity (GPa)', 'Modulus of Rigidity (GPa)', 'Yield Strength (MPa)', 'Ultimate Tensile Strength (MPa)', 'Percent Elongation (%)']
 
     def __init__(self, filename : str) -> None:
         """
@@ -516,6 +1014,19 @@ class MaterialsDatabaseEditor:
         """
         self.filename = filename
         self.database = MaterialsDatabase(self.filename)
+        self.__header_cache = {}  # Formatted headers, keyed by their columns
+        self.__spacer_cache = {}  # Formatted spacers, keyed by their number of columns
+        self.reload_attributes()
+
+    def reload_attributes(self) -> None:
+        """ 
+        Loads the names of the columns & material categories of this editor's database, which are used by the prompts & displays.
+        This must be called again if the database's columns or material categories are altered.
+        """
+        self.database.clear_attribute_cache()
+        self.__columns = [column['name'] for column in self.database.get_columns()]
+        self.__column_displays = {**{column: column for column in self.__columns}, **self.COLUMN_DISPLAYS}  # Display names of every column
+        self.__material_categories = [material_category['category'] for material_category in self.database.get_material_categories()]
 
     ####################################################################################################
     #                                              Prompts                                             #    
@@ -545,33 +1056,30 @@ class MaterialsDatabaseEditor:
         Returns:
             Material category name retrieved from the user.
         """
-        material_categories = [material_category for material_category in self.database.get_material_categories()]
-        material_category = material_categories[get_selection([material_category['category'] for material_category in material_categories], indented=True) - 1]
-        return material_category['category']
+        return self.__material_categories[get_selection(self.__material_categories, indented=True) - 1]
             
-    def __prompt_properties(self):
+    def __prompt_properties(self) -> tuple:
         """
         Prompts the user for a value for each of the properties contained in the material properties database using the command line.
 
         Returns:
-            List of values for each of the properties contained in the material properties database.
+            Tuple of values for each of the properties contained in the material properties database.
+            Properties that are left blank are None, so that they are stored as NULL.
+            Properties that are not finite numbers are prompted for again, so the values already entered are kept.
         """
-        # Prompt properties
-        density = input('\tDensity (kg/m³): ')
-        modulus_of_elasticity = input('\tModulus of Elasticity (GPa): ')
-        modulus_of_rigidity = input('\tModulus of Rigidity (GPa): ')
-        yeild_strength = input('\tYield Strength (MPa): ')
-        ultimate_tensile_strength = input('\tUltimate Tensile Strength (MPa): ')
-        percent_elongation = input('\tPercent Elongation (%): ')
-
-        properties = [density, modulus_of_elasticity, modulus_of_rigidity, yeild_strength, ultimate_tensile_strength, percent_elongation]
-        
-        # Convert properties
-        for i in range(len(properties)):
-            if properties[i]:
-                properties[i] = eval(properties[i])
-
-        return properties
+        properties = []
+        for label in self.PROPERTY_LABELS:
+            value = None
+            valid = False
+            while not valid:
+                response = input(f'\t{label}: ')
+                try:
+                    value = _to_property_value(response)
+                    valid = True
+                except ValueError:
+                    print('Invalid value, please enter a number')
+            properties.append(value)
+        return tuple(properties)
     
     def __prompt_property_column(self) -> str:
         """
@@ -581,9 +1089,8 @@ class MaterialsDatabaseEditor:
         Returns:
             Name of a property contained in the material properties database.
         """
-        columns = self.database.get_columns()
-        selection = get_selection([self.COLUMN_DISPLAYS.get(column['name'], column['name']) for column in columns], indented=True)
-        return columns[selection - 1]['name']
+        selection = get_selection([self.__column_displays[column] for column in self.__columns], indented=True)
+        return self.__columns[selection - 1]
     
     ####################################################################################################
     #                                            Materials                                             #
@@ -592,6 +1099,10 @@ class MaterialsDatabaseEditor:
         """ Prompts the user for & adds a material to this editor's database. """
         try:
             material = self.__prompt_material_name()
+            # Avoid prompting for the remaining values of a material that cannot be added
+            if self.database.material_exists(material):
+                print(f"'{material}' already exists, please update that material instead...")
+                return
             category = self.__prompt_material_category()
             properties = self.__prompt_properties()
             self.database.add_entry(material, category, properties)
@@ -627,7 +1138,7 @@ class MaterialsDatabaseEditor:
         column = self.__prompt_property_column()
 
         if column != 'category':
-            new_value = input(f'\t{self.COLUMN_DISPLAYS.get(column, column)}: ')
+            new_value = input(f'\t{self.__column_displays[column]}: ')
         else:
             new_value = self.__prompt_material_category()
 
@@ -635,9 +1146,11 @@ class MaterialsDatabaseEditor:
             updated_material = self.database.update_entry(material_name, column, new_value)
             if updated_material:
                 material = updated_material
-                print(f"{material_name}'s {self.COLUMN_DISPLAYS.get(column, column)} succesfully updated...")
+                print(f"{material_name}'s {self.__column_displays[column]} succesfully updated...")
         except sqlite3.IntegrityError as e:
             print('A material with that name already exists...')
+        except ValueError:
+            print('Invalid value')
 
         return material
 
@@ -669,7 +1182,7 @@ class MaterialsDatabaseEditor:
         try:
             column = self.__prompt_property_column()
 
-            print(self.COLUMN_DISPLAYS.get(column, column))
+            print(self.__column_displays[column])
             operator = input(f'Operator {Filter.OPERATORS}: ') if column not in ['material', 'category'] else '='
 
             if column == 'material':
@@ -677,11 +1190,14 @@ class MaterialsDatabaseEditor:
             elif column == 'category':
                 value = self.__prompt_material_category()
             else:
-                value = input(f'Value: ')
+                # Compare numeric properties against numbers rather than text
+                value = float(input(f'Value: '))
 
             self.database.add_filter(column, value, operator)
         except Filter.InvalidOperator as e:
             print(e)
+        except ValueError:
+            print('Invalid value')
     
     def remove_filter(self) -> None:
         """ Prompts for & removes a filter from this editor's database. """
@@ -701,25 +1217,34 @@ class MaterialsDatabaseEditor:
     ####################################################################################################
     #                                             Display                                              #
     ####################################################################################################
-    def __print_headers(self, columns:list[str]) -> None:
+    def __format_headers(self, columns:list[str]) -> str:
         """ 
-        Prints a header containing the given columns.
+        Returns a header containing the given columns.
 
         Arguments:
             columns : list[str]
                 List containing column headers to be displayed.
+        Returns:
+            Header line containing the given columns.
         """
-        print(''.join([f'{self.COLUMN_DISPLAYS.get(column, column).center(self.COLUMN_SPACING)}' for column in columns]))
+        columns = tuple(columns)
+        if columns not in self.__header_cache:
+            self.__header_cache[columns] = ''.join([self.__column_displays.get(column, column).center(self.COLUMN_SPACING) for column in columns])
+        return self.__header_cache[columns]
         
-    def __print_spacer(self, num_columns : int) -> None:
+    def __format_spacer(self, num_columns : int) -> str:
         """
-        Prints a spacer large enough to separate the given number of columns.
+        Returns a spacer large enough to separate the given number of columns.
         
         Arguments:
             num_columns : int
                 Number of columns that the spacer will be used to separate.
+        Returns:
+            Spacer line for the given number of columns.
         """
-        print('-'*self.COLUMN_SPACING*num_columns)
+        if num_columns not in self.__spacer_cache:
+            self.__spacer_cache[num_columns] = '-'*self.COLUMN_SPACING*num_columns
+        return self.__spacer_cache[num_columns]
     
     def __get_filter_string(self, filter : Filter) -> str:
         """ 
@@ -731,7 +1256,7 @@ class MaterialsDatabaseEditor:
         Returns:
             Human readable string representing the given filter.
         """
-        return f'{self.COLUMN_DISPLAYS.get(filter.column, filter.column)} {filter.operator} {filter.value}'
+        return f'{self.__column_displays[filter.column]} {filter.operator} {filter.value}'
     
     def display_filters(self) -> None:
         """ Displays the current filters for this editor's database. """
@@ -744,29 +1269,73 @@ class MaterialsDatabaseEditor:
         else:
             print('\tNo filters...')
     
-    def display_materials(self, materials: list[sqlite3.Row]) -> None:
+    def display_materials(self, materials: list[sqlite3.Row], columns : list[str]=None) -> None:
         """
-        Displays the given list of materials using the command line.
+        Displays the given materials using the command line. 
+        The materials are streamed, so any iterable of materials (e.g. a cursor) can be displayed.
 
         Arguments:
             materials : list[sqlite3.Row]
                 Materials that are to be displayed.
+        Optional Arguments:
+            columns : list[str], Default = None
+                Names of the columns contained in the materials, used for the header. 
+                Must be given if the materials are tuples, otherwise the keys of the first material are used.
         """
-        if materials:
-            num_columns = len(materials[0].keys())
-
-            self.__print_headers(materials[0].keys())
-            self.__print_spacer(num_columns)
-            for material in materials:
-                print(''.join([f'{round(column, 1) if isinstance(column, (int, float)) else column}'.center(self.COLUMN_SPACING) for column in material]))
-            self.__print_spacer(num_columns)
+        materials = iter(materials)
+        first_material = next(materials, None)
+
+        if first_material is not None:
+            if columns is None:
+                columns = first_material.keys()
+            num_columns = len(columns)
+
+            spacer = self.__format_spacer(num_columns)
+            sys.stdout.write(self.__format_headers(columns) + '\n' + spacer + '\n')
+            sys.stdout.writelines(''.join(f'{round(column, 1) if isinstance(column, (int, float)) else "" if column is None else column}'.center(self.COLUMN_SPACING) for column in material) + '\n' 
+                                  for material in itertools.chain([first_material], materials))
+            sys.stdout.write(spacer + '\n')
         else:
             print('No Materials...')
     
+    def __display_pages(self, get_page) -> None:
+        """
+        Displays materials one page at a time, prompting the user to move between the pages.
+
+        Arguments:
+            get_page : callable
+                Function returning the page of materials following the given entry, get_page(limit, after).
+                The first page is returned if the entry is None.
+        """
+        page_starts = [None]  # Entries after which each of the displayed pages start
+        done_pages = False
+        while not done_pages:
+            # One extra material is fetched to indicate whether or not there is a next page
+            materials = list(get_page(self.PAGE_SIZE + 1, page_starts[-1]))
+            has_next_page = len(materials) > self.PAGE_SIZE
+            materials = materials[:self.PAGE_SIZE]
+            self.display_materials(materials, self.__columns)
+
+            if not has_next_page and len(page_starts) == 1:
+                done_pages = True
+            else:
+                selection_page = get_selection(['Next Page', 'Previous Page', 'Done'])
+                if selection_page == 1:
+                    if has_next_page:
+                        page_starts.append(materials[-1])
+                    else:
+                        print('No next page...')
+                elif selection_page == 2:
+                    if len(page_starts) > 1:
+                        page_starts.pop()
+                    else:
+                        print('No previous page...')
+                elif selection_page == 3:
+                    done_pages = True
+
     def display_all_materials(self):
         """ Displays all of the materials currently contained in this editor's database. """
-        materials = self.database.get_all_entries()
-        self.display_materials(materials)
+        self.__display_pages(lambda limit, after: self.database.get_all_entries(limit=limit, after=after))
     
     def display_material(self):
         """ Prompts for & displays a specific material currently contained in this editor's database. """
@@ -783,18 +1352,19 @@ class MaterialsDatabaseEditor:
         if order_by_response:
             kwargs['order_by'] = order_by_response
         
+        # Only a response starting with 'n' selects descending order, a blank response keeps ascending order
         descending_response = input('Ascending (Y/n): ')
-        if descending_response:
-            kwargs['descending'] = descending_response[0].upper() == 'N'
+        kwargs['descending'] = descending_response[:1] in {'N', 'n'}
 
-        materials = self.database.get_all_entries(**kwargs)
-        self.display_materials(materials)
+        self.__display_pages(lambda limit, after: self.database.get_all_entries(limit=limit, after=after, **kwargs))
     
     def display_filtered_materials(self):
         """ Displays all materials currently contained in this editor's database that satisfy the database's current filters. """
         if self.database.get_filters():
-            materials = self.database.get_filtered_entries()
-            self.display_materials(materials)
+            num_materials = self.database.get_filtered_count()
+            print(f'{num_materials} Materials')
+
+            self.__display_pages(self.database.get_filtered_entries)
         else:
             # Display all materials if no filters are present
             self.display_all_materials()
@@ -890,21 +1460,18 @@ def get_selection(options : list[str], indented : bool=False) -> int:
             Indication of whether or not the list of options should be indented when displayed.
             True if should be indented, false otherwise.
     """
+    # The displayed options are the same for every attempt, so they are only built once
+    tab = '' if not indented else '\t'
+    prompt = ''.join(f'{tab}{i+1}) {option}\n' for i, option in enumerate(options)) + 'Selection: '
+
     valid = False
     while not valid:
-        try:
-            tab = '' if not indented else '\t'
-            string = ''
-            for i, choice in enumerate(options):
-                string += tab + f'{i+1}) {choice}\n'
-            choice = int(input(string + 'Selection: '))
-        except ValueError:
-            valid = False
-        else:
-            valid = (1 <= choice <= len(options))
+        selection = input(prompt).strip()
+        # Only plain decimal selections are parsed, so invalid selections never raise
+        valid = selection.isdecimal() and (1 <= int(selection) <= len(options))
         if not valid:
             print('Invalid selection, please select again')                
-    return choice
+    return int(selection)
 
 
 def command_line():
@@ -922,6 +1489,8 @@ def command_line():
                 editor = MaterialsDatabaseEditor(filename)
             except sqlite3.OperationalError:
                 print(f'{filename} does not currently exist...')
+            except sqlite3.DatabaseError:
+                print(f'{filename} is not a valid database...')
             else:
                 editor.edit_database()
         elif selection_main == 3:
@@ -949,6 +1518,8 @@ if __name__ == '__main__':
                 editor = MaterialsDatabaseEditor(args.filename)
             except sqlite3.OperationalError:
                 print(f'{args.filename} does not currently exist...')
+            except sqlite3.DatabaseError:
+                print(f'{args.filename} is not a valid database...')
             else:
                 editor.edit_database()
         else: